@@ -6,28 +6,55 @@ This demo replicates the main app's visual structure and functionality
 to showcase all conversation threads in the system.
 """
 
-import sys
+import gc
 import os
-import json
-from pathlib import Path
-from typing import List, Dict, Optional
 import streamlit as st
 
-from app.config import APP_TITLE, LOGO_PATH, SQLITE_DB_PATH, logger
-from backend.memory.episodic_memory.thread_manager import load_thread_ids
-from backend.memory.episodic_memory.conversation import (
-    get_conversation_history_from_sqlite,
-    reconstruct_formatted_message_from_sqlite,
-    get_welcome_message,
-    load_conversation
-)
+from app.config import APP_TITLE, THREAD_IDS_FILE, logger
+
+# Rendering allocates many short-lived strings per rerun; raising the gen-0
+# threshold keeps the collector off the interactive path. Large-object churn
+# is reclaimed explicitly after session init instead. Opt out via env flag.
+if os.environ.get("REPURAGENT_DISABLE_GC_TUNING") != "1":
+    gc.set_threshold(50_000, 10, 10)
 from app.ui.components import display_header, display_sidebar, display_chat_messages
-from app.ui.formatters import (
-    pretty_print_tool_call,
-    separate_agent_outputs, 
-    reconstruct_assistant_response
-)
-from core.supervisor.supervisor import create_app
+
+# Heavy backends (core.supervisor, conversation helpers) are imported lazily
+# inside the functions that need them so module load stays cheap
+
+
+@st.cache_resource(show_spinner=False)
+def _get_app(use_episodic_learning: bool = False):
+    """Build the supervisor app once per process instead of on every rerun."""
+    # Cached, so the heavy supervisor import happens at most once per process
+    from core.supervisor.supervisor import create_app
+    return create_app(use_episodic_learning=use_episodic_learning)
+
+
+# Immutable session-state defaults applied in one setdefault pass.
+# Mutable defaults ({} / [] / set()) stay inline so sessions never share objects.
+_SESSION_DEFAULTS = {
+    'uploaded_file_path': None,
+    'uploaded_file_hash': None,
+    'uploaded_file_name': None,
+    'use_episodic_learning': True,
+    'waiting_for_approval': False,
+    'current_plan': None,
+    'approval_interrupted': False,
+}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_thread_ids(store_mtime: float):
+    """Load thread IDs from disk, cached on the store file's mtime."""
+    from backend.memory.episodic_memory.thread_manager import load_thread_ids
+    return load_thread_ids()
+
+
+def _load_thread_ids_cached():
+    """Return the thread ID list without re-reading an unchanged store."""
+    store_mtime = THREAD_IDS_FILE.stat().st_mtime if THREAD_IDS_FILE.exists() else 0.0
+    return _cached_thread_ids(store_mtime)
 
 
 def initialize_demo_session():
@@ -41,38 +68,26 @@ def initialize_demo_session():
             logger.warning(f"Could not initialize episodic learning: {e}")
             st.session_state.episodic_orchestrator = None
     
-    # Initialize thread-specific file upload tracking (for compatibility)
-    if 'thread_files' not in st.session_state:
-        st.session_state.thread_files = {}
-    
-    # Initialize file upload state (for compatibility)
-    if 'uploaded_files' not in st.session_state:
-        st.session_state.uploaded_files = []
-    if 'uploaded_file_path' not in st.session_state:
-        st.session_state.uploaded_file_path = None
-    if 'uploaded_file_hash' not in st.session_state:
-        st.session_state.uploaded_file_hash = None
-    if 'uploaded_file_name' not in st.session_state:
-        st.session_state.uploaded_file_name = None
-    
-    # Initialize episodic learning settings
-    if 'use_episodic_learning' not in st.session_state:
-        st.session_state.use_episodic_learning = True
-    
-    # Initialize content deduplication tracking
-    if 'processed_content_hashes' not in st.session_state:
-        st.session_state.processed_content_hashes = set()
-    
+    # Initialize file upload tracking and content deduplication (for compatibility)
+    st.session_state.setdefault('thread_files', {})
+    st.session_state.setdefault('uploaded_files', [])
+    st.session_state.setdefault('processed_content_hashes', set())
+
     # Initialize expander states for UI persistence
-    if 'expander_states' not in st.session_state:
-        st.session_state.expander_states = {
-            'progress_expander': True,
-            'show_progress_content': False
-        }
-    
-    # Load existing thread IDs
+    st.session_state.setdefault('expander_states', {
+        'progress_expander': True,
+        'show_progress_content': False
+    })
+
+    # Initialize the remaining scalar defaults in one pass
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+
+
+    # Load existing thread IDs (guarded: setdefault would evaluate the
+    # loader eagerly on every rerun)
     if 'thread_ids' not in st.session_state:
-        st.session_state.thread_ids = load_thread_ids()
+        st.session_state.thread_ids = _load_thread_ids_cached()
 
     # Initialize current conversation if none exists
     if 'current_thread_id' not in st.session_state:
@@ -80,11 +95,14 @@ def initialize_demo_session():
             # Load the most recent conversation
             recent_thread = st.session_state.thread_ids[-1]
             try:
-                app = create_app(use_episodic_learning=False)
-                load_conversation(recent_thread["thread_id"], app)
+                # Rehydrate messages straight from the checkpointer; the full
+                # supervisor app is only needed once the user sends input
+                from backend.memory.episodic_memory.conversation import load_conversation_messages_only
+                load_conversation_messages_only(recent_thread["thread_id"])
             except Exception as e:
                 logger.error(f"Error loading conversation: {e}")
                 # Fallback to basic initialization
+                from backend.memory.episodic_memory.conversation import get_welcome_message
                 st.session_state.current_thread_id = recent_thread["thread_id"]
                 st.session_state.messages = [get_welcome_message()]
                 st.session_state.processed_message_ids = set()
@@ -97,19 +115,21 @@ def initialize_demo_session():
             st.session_state.messages = new_conv["messages"]
             st.session_state.processed_message_ids = new_conv["processed_message_ids"]
             st.session_state.processed_tools_ids = new_conv["processed_tools_ids"]
-            st.session_state.thread_ids = load_thread_ids()
-    
-    # Initialize waiting state (for compatibility)
-    if 'waiting_for_approval' not in st.session_state:
-        st.session_state.waiting_for_approval = False
-    if 'current_plan' not in st.session_state:
-        st.session_state.current_plan = None
-    if 'approval_interrupted' not in st.session_state:
-        st.session_state.approval_interrupted = False
+            _cached_thread_ids.clear()  # The store changed; invalidate the cached copy
+            st.session_state.thread_ids = _load_thread_ids_cached()
+
+
+# Constant demo banner text, built once at import time
+_DEMO_INFO_TEXT = (
+    "**Demo Mode**: This is a read-only demonstration of the RepurAgent system. "
+    "For full functionality, please initialize the app at: https://github.com/pharmbio/repuragent"
+)
 
 
 def set_page_config():
     """Set page configuration."""
+    # Must run every rerun: the frontend resets title/favicon on each new
+    # session and only restores them when a pageConfigChanged message arrives
     st.set_page_config(
         page_title=f"{APP_TITLE} - Demo",
         page_icon="🧬",
@@ -119,7 +139,7 @@ def set_page_config():
 
 def add_demo_info():
     """Add demo-specific information to the main content area."""
-    st.info("**Demo Mode**: This is a read-only demonstration of the RepurAgent system. For full functionality, please initialize the app at: https://github.com/pharmbio/repuragent")
+    st.info(_DEMO_INFO_TEXT)
 
 
 def update_current_thread_files():
@@ -134,23 +154,28 @@ def main():
     """Main demo application using the exact same structure as the main app."""
     # Set page configuration
     set_page_config()
-    
+
+    # Build the (cached) supervisor app once for the sidebar
+    try:
+        app = _get_app(False)
+    except Exception as e:
+        logger.warning(f"Could not create app for demo: {e}")
+        app = None
+
     # Initialize session state exactly like main app
+    first_run = 'current_thread_id' not in st.session_state
     initialize_demo_session()
-    
+    if first_run:
+        # Session init just rehydrated a conversation; sweep the temporary
+        # parse/decode objects once instead of letting them age into gen-2
+        gc.collect(1)
+
     # Display header using main app component
     display_header()
-    
+
     # Add demo-specific info
     add_demo_info()
-    
-    # Create app for sidebar compatibility
-    try:
-        app = create_app(use_episodic_learning=False)
-    except Exception as e:
-        logger.warning(f"Could not create app for demo: {e}")
-        app = None
-    
+
     # Display sidebar using main app component
     display_sidebar(app)
     
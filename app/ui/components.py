@@ -1,4 +1,7 @@
 import base64
+import functools
+import re
+from pathlib import Path
 import streamlit as st
 from typing import List, Dict, Optional
 from app.config import APP_TITLE, LOGO_PATH, SQLITE_DB_PATH
@@ -14,20 +17,33 @@ def get_image_base64(file_path: str) -> str:
     return base64.b64encode(data).decode()
 
 
+# Streamlit serves ./static at app/static/ when enableStaticServing is on
+_STATIC_DIR = Path("static")
+
+
+@functools.lru_cache(maxsize=1)
+def _logo_html() -> str:
+    """Build the header HTML (logo + title) once for the app's lifetime."""
+    logo_name = Path(LOGO_PATH).name
+    if (_STATIC_DIR / logo_name).exists():
+        # Reference the static asset by URL: the per-rerun payload is a short
+        # path and the browser caches the image itself
+        logo_src = f"./app/static/{logo_name}"
+    else:
+        # Fallback for deployments without static serving enabled
+        logo_src = f"data:image/png;base64,{get_image_base64(LOGO_PATH)}"
+    return f"""
+        <div style="display: flex; align-items: center;">
+            <img src="{logo_src}" width="60" style="margin-right: 10px;">
+            <h1 style="margin: 0;">{APP_TITLE}</h1>
+        </div>
+        """
+
+
 def display_header():
     """Display the application header with logo."""
     try:
-        logo_base64 = get_image_base64(LOGO_PATH)
-        
-        st.markdown(
-            f"""
-            <div style="display: flex; align-items: center;">
-                <img src="data:image/png;base64,{logo_base64}" width="60" style="margin-right: 10px;">
-                <h1 style="margin: 0;">{APP_TITLE}</h1>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        st.markdown(_logo_html(), unsafe_allow_html=True)
     except Exception as e:
         # Fallback to text-only header
         st.title(APP_TITLE)
@@ -113,23 +129,22 @@ def add_episodic_controls() -> None:
 def _display_conversation_list(app) -> None:
     """Display the list of conversations in the sidebar."""
     if st.session_state.thread_ids:
-        for i, thread_data in enumerate(reversed(st.session_state.thread_ids)):  # Show most recent first
+        for thread_data in reversed(st.session_state.thread_ids):  # Show most recent first
             thread_id = thread_data["thread_id"]
             is_current = thread_id == st.session_state.current_thread_id
-            
+
             # Create a container for each conversation
             with st.container():
                 col1, col2 = st.columns([4, 1])
-                
+
                 with col1:
                     # Conversation button
                     button_style = "🔵 " if is_current else "💬 "
-                    conv_title = thread_data["title"]
-                    if len(conv_title) > 30:
-                        conv_title = conv_title[:30] + "..."
-                    
-                    if st.button(f"{button_style}{conv_title}", 
-                               key=f"thread_{thread_id}", 
+                    # Pre-truncated at write time by thread_manager
+                    conv_title = thread_data.get("display_title", thread_data["title"])
+
+                    if st.button(f"{button_style}{conv_title}",
+                               key=f"thread_{thread_id}",
                                use_container_width=True,
                                disabled=is_current):
                         from backend.memory.episodic_memory.conversation import load_conversation
@@ -143,11 +158,20 @@ def _display_conversation_list(app) -> None:
 
 
 
+@st.cache_data(ttl=5, show_spinner=False)
+def _database_size_mb() -> Optional[float]:
+    """Return the database size in MB, or None if the file doesn't exist."""
+    try:
+        return SQLITE_DB_PATH.stat().st_size / (1024 * 1024)
+    except FileNotFoundError:
+        return None
+
+
 def _display_database_info() -> None:
     """Display database information in the sidebar."""
     st.caption(f"💾 Memory: {SQLITE_DB_PATH.name}")
-    if SQLITE_DB_PATH.exists():
-        size_mb = SQLITE_DB_PATH.stat().st_size / (1024 * 1024)
+    size_mb = _database_size_mb()
+    if size_mb is not None:
         st.caption(f"📊 Size: {size_mb:.2f} MB")
 
 
@@ -196,51 +220,93 @@ def render_markdown_with_tool_blocks(markdown: str, *, label: str = "🛠️ Too
             )
 
 
+# Precompiled header classifiers: one scan per line instead of repeated
+# str.upper() + substring searches per agent name.
+_PROGRESS_HEADER_RE = re.compile(
+    r'^\*\*[^*]*(SUPERVISOR|RESEARCH_AGENT|DATA_AGENT|PREDICTION_AGENT)[^*]*\*\*$', re.I
+)
+_FINAL_HEADER_RE = re.compile(
+    r'^\*\*[^*]*(PLANNING_AGENT|REPORT_AGENT)[^*]*\*\*$', re.I
+)
+
+# Exact-token fast path: bare headers like "**SUPERVISOR**" resolve with one
+# set lookup; decorated headers fall back to the regexes above.
+_PROGRESS_AGENTS = frozenset({"SUPERVISOR", "RESEARCH_AGENT", "DATA_AGENT", "PREDICTION_AGENT"})
+_FINAL_AGENTS = frozenset({"PLANNING_AGENT", "REPORT_AGENT"})
+
+
+def _split_agent_sections(content: str) -> tuple:
+    """Split assistant content into (final, progress) sections in one pass.
+
+    No caching here: display_chat_messages stashes the result on each
+    message dict, so loaded messages are only ever split once.
+    """
+    progress_lines: List[str] = []
+    final_lines: List[str] = []
+    current_section = "final"  # Default to final
+
+    for line in content.split('\n'):
+        # Only header-shaped lines pay the upper()/lookup cost
+        if line.startswith('**') and line.endswith('**') and len(line) > 4:
+            token = line[2:-2].strip().upper()
+            if token in _PROGRESS_AGENTS:
+                current_section = "progress"
+            elif token in _FINAL_AGENTS:
+                current_section = "final"
+            # Decorated headers (e.g. "**[SUPERVISOR]:**") need the regexes
+            elif _PROGRESS_HEADER_RE.match(line):
+                current_section = "progress"
+            elif _FINAL_HEADER_RE.match(line):
+                current_section = "final"
+            # For other agent headers, maintain current section
+
+        # Add line to appropriate section
+        if current_section == "progress":
+            progress_lines.append(line)
+        else:
+            final_lines.append(line)
+
+    return '\n'.join(final_lines), '\n'.join(progress_lines)
+
+
+def _render_assistant_sections(final_content: str, progress_content: str) -> None:
+    """Render a pre-split assistant message (final sections + progress expander)."""
+    # Display final content first (Planning and Report agents)
+    if final_content.strip():
+        render_markdown_with_tool_blocks(final_content, label="🛠️ Tools Calling")
+
+    # Display progress content in expander if it exists
+    if progress_content.strip():
+        # For historical messages, always show expander if there's content
+        with st.expander("🔄 Processing Progress", expanded=False):
+            render_markdown_with_tool_blocks(
+                progress_content,
+                label="🛠️ Tools Calling",
+                expanded=False
+            )
+
+
+@st.fragment
 def display_chat_messages(messages: List[Dict[str, str]]) -> None:
-    """Display chat messages in the main area with enhanced formatting for agent outputs."""
+    """Display chat messages in the main area with enhanced formatting for agent outputs.
+
+    Runs as a fragment so interactions scoped to the history area rerun
+    only this function instead of the whole script.
+    """
     for message in messages:
-        with st.chat_message(message["role"]):
-            content = message["content"]
-            
-            # Check if this is an assistant message with agent outputs
-            if message["role"] == "assistant" and content:
-                # Split content into progress agents (expander) and final agents (main display)
-                progress_content = ""
-                final_content = ""
-                
-                # Parse content to separate different agents while preserving chronological order
-                lines = content.split('\n')
-                current_section = "final"  # Default to final
-                
-                for line in lines:
-                    # Check for agent headers to determine section
-                    line_upper = line.upper()
-                    if line.startswith('**') and line.endswith('**'):
-                        if any(agent in line_upper for agent in ["SUPERVISOR", "RESEARCH_AGENT", "DATA_AGENT", "PREDICTION_AGENT"]):
-                            current_section = "progress"
-                        elif any(agent in line_upper for agent in ["PLANNING_AGENT", "REPORT_AGENT"]):
-                            current_section = "final"
-                        # For other agent headers, maintain current section
-                    
-                    # Add line to appropriate section
-                    if current_section == "progress":
-                        progress_content += line + '\n'
-                    else:
-                        final_content += line + '\n'
-                
-                # Display final content first (Planning and Report agents)
-                if final_content.strip():
-                    render_markdown_with_tool_blocks(final_content, label="🛠️ Tools Calling")
-                
-                # Display progress content in expander if it exists
-                if progress_content.strip():
-                    # For historical messages, always show expander if there's content
-                    with st.expander("🔄 Processing Progress", expanded=False):
-                        render_markdown_with_tool_blocks(
-                            progress_content,
-                            label="🛠️ Tools Calling",
-                            expanded=False
-                        )
+        role = message["role"]
+        content = message["content"]
+
+        with st.chat_message(role):
+            # Only assistant messages carry agent outputs that need splitting
+            if role == "assistant" and content:
+                # Historical messages are immutable: split once, then the
+                # stored sections make later reruns a pure dict lookup
+                sections = message.get("_sections")
+                if sections is None:
+                    sections = _split_agent_sections(content)
+                    message["_sections"] = sections
+                _render_assistant_sections(*sections)
             else:
                 # Regular display for user messages or simple assistant messages
                 st.markdown(content)
@@ -1,6 +1,8 @@
+import sqlite3
 from typing import List, Dict, Set, Any, Optional
 from datetime import datetime
-from app.config import logger
+from langgraph.checkpoint.sqlite import SqliteSaver
+from app.config import SQLITE_DB_PATH, logger
 from app.ui.formatters import reconstruct_assistant_response
 from backend.memory.episodic_memory.thread_manager import add_thread_id, generate_new_thread_id
 
@@ -164,6 +166,92 @@ def create_new_conversation() -> Dict[str, Any]:
     return conversation_data
 
 
+# Shared read connection: opening a fresh sqlite3 connection per call pays
+# connection-setup latency on every conversation switch. Held for the
+# process lifetime; this module is not Streamlit-bound, so a plain module
+# singleton is used instead of st.cache_resource.
+_checkpointer: Optional[SqliteSaver] = None
+
+
+def _get_checkpointer() -> SqliteSaver:
+    """Return a process-wide SqliteSaver on a shared, tuned connection."""
+    global _checkpointer
+    if _checkpointer is None:
+        connection = sqlite3.connect(str(SQLITE_DB_PATH), check_same_thread=False)
+        connection.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-64000;"
+        )
+        _checkpointer = SqliteSaver(connection)
+    return _checkpointer
+
+
+def get_raw_messages_from_checkpointer(thread_id: str) -> List:
+    """Read raw checkpoint messages for a thread directly from SQLite.
+
+    Goes through SqliteSaver only, so no supervisor graph is constructed.
+    """
+    try:
+        checkpointer = _get_checkpointer()
+        checkpoint = checkpointer.get({"configurable": {"thread_id": thread_id}})
+
+        if checkpoint and checkpoint.get("channel_values"):
+            return checkpoint["channel_values"].get("messages", []) or []
+        return []
+    except Exception as e:
+        logger.error(f"Error reading checkpoint for thread {thread_id}: {e}")
+        return []
+
+
+def load_conversation_messages_only(thread_id: str) -> None:
+    """Load a conversation for display without constructing the supervisor app."""
+    import streamlit as st
+
+    raw_messages = get_raw_messages_from_checkpointer(thread_id)
+    messages = reconstruct_formatted_message_from_sqlite(raw_messages)
+
+    # If no messages found, add welcome message
+    if not messages:
+        messages = [get_welcome_message()]
+
+    # Mark all historical message IDs as processed
+    processed_message_ids = {
+        msg.id for msg in raw_messages if getattr(msg, "id", None)
+    }
+
+    # Set session state
+    st.session_state.current_thread_id = thread_id
+    st.session_state.messages = messages
+    st.session_state.processed_message_ids = processed_message_ids
+    st.session_state.processed_tools_ids = set()
+
+    # Reset content deduplication for new conversation
+    st.session_state.processed_content_hashes = set()
+
+    # Check if loaded messages contain progress content to determine expander state
+    has_progress_content = False
+    for msg in messages:
+        if msg.get("role") == "assistant":
+            content = msg.get("content", "")
+            # Check if content contains agent headers that indicate progress content
+            if any(agent.upper() in content for agent in ["SUPERVISOR", "RESEARCH_AGENT", "DATA_AGENT", "PREDICTION_AGENT"]):
+                has_progress_content = True
+                break
+
+    # Update expander states based on loaded content
+    if 'expander_states' not in st.session_state:
+        st.session_state.expander_states = {}
+    st.session_state.expander_states['show_progress_content'] = has_progress_content
+    st.session_state.expander_states['progress_expander'] = True  # Default to expanded
+
+    # Update thread-specific files for the loaded conversation
+    if hasattr(st.session_state, 'thread_files'):
+        from app.streamlit_app import update_current_thread_files
+        update_current_thread_files()
+
+
 def load_conversation(thread_id: str, app):
     """Load a conversation from persistent storage with formatting preserved."""
     import streamlit as st
@@ -6,12 +6,26 @@ from typing import List, Dict, Optional
 from app.config import THREAD_IDS_FILE, SQLITE_DB_PATH, logger
 
 
+# Sidebar titles longer than this are truncated for display
+TITLE_DISPLAY_LIMIT = 30
+
+
+def _with_display_title(thread_data: Dict) -> Dict:
+    """Attach the truncated sidebar title so renders do no per-rerun work."""
+    title = thread_data.get("title", "")
+    if len(title) > TITLE_DISPLAY_LIMIT:
+        thread_data["display_title"] = title[:TITLE_DISPLAY_LIMIT] + "..."
+    else:
+        thread_data["display_title"] = title
+    return thread_data
+
+
 def load_thread_ids() -> List[Dict]:
     """Load thread IDs from JSON file."""
     try:
         if THREAD_IDS_FILE.exists():
             with open(THREAD_IDS_FILE, 'r') as f:
-                return json.load(f)
+                return [_with_display_title(t) for t in json.load(f)]
         return []
     except Exception as e:
         logger.error(f"Error loading thread IDs: {e}")
@@ -30,18 +44,18 @@ def save_thread_ids(thread_ids: List[Dict]) -> None:
 def add_thread_id(thread_id: str, title: Optional[str] = None) -> None:
     """Add a new thread ID to the persistent storage."""
     thread_ids = load_thread_ids()
-    
+
     # Check if thread already exists
     if any(t["thread_id"] == thread_id for t in thread_ids):
         return
     
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    thread_data = {
+    thread_data = _with_display_title({
         "thread_id": thread_id,
         "created_at": timestamp,
         "title": title or f"Conversation {timestamp}"
-    }
-    
+    })
+
     thread_ids.append(thread_data)
     save_thread_ids(thread_ids)
 
@@ -92,6 +106,7 @@ def update_thread_title(thread_id: str, new_title: str) -> None:
     for thread in thread_ids:
         if thread["thread_id"] == thread_id:
             thread["title"] = new_title
+            _with_display_title(thread)
             break
     save_thread_ids(thread_ids)
 